@@ -10,28 +10,128 @@ Usage:
     python main.py --debug      # Show raw document content for debugging
 """
 
+import hashlib
 import os
+import pickle
 import re
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import yaml
-from dateutil import parser as date_parser
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from icalendar import Calendar, Event
-import pytz
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile(pattern: str, flags=re.IGNORECASE):
+    """
+    Compile a pattern with google-re2's linear-time DFA engine when
+    installed, falling back to stdlib re - per pattern, since re2 rejects
+    constructs like lookaheads that a few patterns below use.
+    """
+    if RE2_AVAILABLE:
+        # re2 takes an Options object, not stdlib flags; silence its
+        # error log since lookahead patterns are expected to fail over
+        opts = re2.Options()
+        opts.case_sensitive = not (flags & re.IGNORECASE)
+        opts.log_errors = False
+        try:
+            return re2.compile(pattern, opts)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
 
 
 # Google API scopes - read-only access to Google Docs
 SCOPES = ['https://www.googleapis.com/auth/documents.readonly']
 
 # Timezone for events (adjust as needed)
-TIMEZONE = pytz.timezone('America/Los_Angeles')
+TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+# Month name patterns shared by the event regexes below
+_MONTHS = r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+# Cross-month ranges also accept abbreviations like "Dec."
+_MONTHS_CROSS = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+# Non-capturing variant for use inside lookaheads
+_MONTHS_NC = _MONTHS.replace('(', '(?:', 1)
+
+# Precompiled event-line patterns. parse_events runs these on every line of
+# the document, so compiling once at import time avoids repeated trips
+# through re's pattern cache in the hot loop.
+_RE_HAS_MONTH = _compile(_MONTHS, re.IGNORECASE)
+# Cheap prefilter: any line worth matching contains a month token, so the
+# six-pattern cascade below can be skipped entirely for headers, day-name
+# lines and other prose. The abbreviations also prefix the full names.
+_RE_HAS_MONTH_TOKEN = _compile(
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', re.IGNORECASE)
+_RE_DAY_NAME_DATE = _compile(
+    rf'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+{_MONTHS}\s+(\d{{1,2}}),?\s*(\d{{4}})?',
+    re.IGNORECASE)
+# Covers both "Month Day & Day" and "Month Day – Day" ranges in one pass
+_RE_DAY_RANGE = _compile(
+    rf'^{_MONTHS}\s+(\d{{1,2}})\s*[–\-&]\s*(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(.+)$',
+    re.IGNORECASE)
+_RE_CROSS_MONTH = _compile(
+    rf'^{_MONTHS}\s+(\d{{1,2}})\s*[–\-]\s*{_MONTHS_CROSS}\.?\s*(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(.+)$',
+    re.IGNORECASE)
+# The lookaheads reject descriptions that are really another date
+# (a month name or bare digits), which used to need two extra regex
+# calls on every successful match
+_RE_SINGLE_DATE = _compile(
+    rf'^{_MONTHS}\s+(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(?!{_MONTHS_NC})(?!\d+,?\s*$)(\S.*)$',
+    re.IGNORECASE)
+_RE_STANDALONE_DATE = _compile(
+    rf'^{_MONTHS}\s+(\d{{1,2}}),?\s*(\d{{4}})?$',
+    re.IGNORECASE)
+
+# Vectorized prefilter for large documents: keeps section markers, the
+# special header lines the loop tracks, and anything with a month token.
+# All other lines are no-ops in the parse loop and can be dropped up front.
+_PREFILTER_PAT = (r'_____|Early Release|First Day of School|Last Day of School'
+                  r'|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec')
+_VECTORIZE_MIN_LINES = 500
+
+# Month name (full or abbreviated, lowercase) -> month number, so matched
+# lines can build datetime objects directly instead of going through
+# dateutil's much slower free-form parser.
+_MONTH_TO_INT = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11,
+    'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Months in the first (fall) half of the school year; everything else
+# belongs to the following calendar year.
+_FALL_MONTHS = frozenset(['aug', 'sep', 'oct', 'nov', 'dec'])
+
+# School name abbreviations, expanded in a single regex pass. The optional
+# '\*?' covers the starred variants ("*FH") without separate patterns.
+_ABBR_MAP = {
+    'FH': 'Fox Hill',
+    'PG': 'Pine Glen',
+    'MEM': 'Memorial',
+    'FW': 'Francis Wyman',
+}
+_ABBR_RE = re.compile(r'\*?\b(FH|PG|MEM|FW)\b')
 
 
 def load_config(config_path: str = 'config.yaml') -> dict:
@@ -90,43 +190,81 @@ def get_google_docs_service():
     return build('docs', 'v1', credentials=creds)
 
 
-def read_document(service, doc_id: str) -> str:
-    """Read the content of a Google Doc and return as plain text."""
-    try:
-        document = service.documents().get(documentId=doc_id).execute()
+# Only the text runs are used, so skip styles, lists, inline objects etc.
+# that dominate the full payload (partial-response fields mask)
+_DOC_FIELDS = 'body/content/paragraph/elements/textRun/content'
+
+# Google API batches are limited to 100 calls per request
+_BATCH_LIMIT = 100
+
 
-        # Extract text from document content
-        content = document.get('body', {}).get('content', [])
-        text_parts = []
+def _extract_text(document: dict) -> str:
+    """Extract plain text from a Docs API document resource."""
+    # A generator feeding ''.join avoids materializing a list of every
+    # textRun for large docs
+    content = document.get('body', {}).get('content', [])
+    return ''.join(
+        para_element['textRun']['content']
+        for element in content if 'paragraph' in element
+        for para_element in element['paragraph'].get('elements', ())
+        if 'textRun' in para_element and 'content' in para_element['textRun']
+    )
 
-        for element in content:
-            if 'paragraph' in element:
-                for para_element in element['paragraph'].get('elements', []):
-                    if 'textRun' in para_element:
-                        text_parts.append(para_element['textRun'].get('content', ''))
 
-        return ''.join(text_parts)
+def read_document(service, doc_id: str) -> str:
+    """Read the content of a Google Doc and return as plain text."""
+    try:
+        document = service.documents().get(
+            documentId=doc_id,
+            fields=_DOC_FIELDS
+        ).execute()
+        return _extract_text(document)
 
     except HttpError as error:
         print(f"Error reading document: {error}")
         sys.exit(1)
 
 
+def read_documents(service, doc_ids: list) -> list:
+    """
+    Read multiple Google Docs and return their texts in the same order.
+
+    Uses a batched HTTP request so all docs share one round-trip instead
+    of one blocking fetch each; chunks at the API's 100-call batch limit.
+    """
+    if len(doc_ids) == 1:
+        return [read_document(service, doc_ids[0])]
+
+    texts = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            print(f"Warning: error reading document {request_id}: {exception}")
+            texts[request_id] = ''
+        else:
+            texts[request_id] = _extract_text(response)
+
+    for start in range(0, len(doc_ids), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_collect)
+        for doc_id in doc_ids[start:start + _BATCH_LIMIT]:
+            batch.add(
+                service.documents().get(documentId=doc_id, fields=_DOC_FIELDS),
+                request_id=doc_id
+            )
+        batch.execute()
+
+    return [texts.get(doc_id, '') for doc_id in doc_ids]
+
+
 def get_school_year(month_name: str, default_year: int) -> int:
     """
     Determine the year based on month for a school calendar.
     School year runs August-December (first year) and January-June (next year).
     """
-    fall_months = ['august', 'september', 'october', 'november', 'december']
-    spring_months = ['january', 'february', 'march', 'april', 'may', 'june', 'july']
-
-    month_lower = month_name.lower()[:3]  # Handle both full and abbreviated
-
-    if any(month_lower == m[:3] for m in fall_months):
+    # [:3] handles both full and abbreviated month names
+    if month_name.lower()[:3] in _FALL_MONTHS:
         return default_year  # 2025
-    elif any(month_lower == m[:3] for m in spring_months):
-        return default_year + 1  # 2026
-    return default_year
+    return default_year + 1  # 2026
 
 
 def parse_events(text: str, default_year: int) -> list:
@@ -142,8 +280,13 @@ def parse_events(text: str, default_year: int) -> list:
 
     lines = text.split('\n')
 
-    MONTHS = r'(January|February|March|April|May|June|July|August|September|October|November|December)'
-    MONTHS_SHORT = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+    # For big documents, drop irrelevant lines in one vectorized pass so
+    # the Python loop below only sees candidates. pandas runs the regex
+    # in a tight C loop, much faster than per-line interpreter overhead.
+    if PANDAS_AVAILABLE and len(lines) > _VECTORIZE_MIN_LINES:
+        mask = pd.Series(lines).str.contains(_PREFILTER_PAT, regex=True,
+                                             case=False, na=False)
+        lines = [line for line, keep in zip(lines, mask) if keep]
 
     # Track the current section header
     current_section = None
@@ -164,129 +307,123 @@ def parse_events(text: str, default_year: int) -> list:
             continue
 
         # Detect section headers (lines starting with _____)
-        if line.startswith('_____'):
-            section_text = line.replace('_____', '').strip()
+        if line[:5] == '_____':
+            # One C-level strip of the marker and padding, instead of a
+            # full replace() pass plus a second strip()
+            section_text = line.strip('_ \t')
             if section_text:
-                current_section = section_text
+                # Interned so the many events sharing a section header
+                # reference one string object instead of N copies
+                current_section = sys.intern(section_text)
             continue
 
         # Detect descriptive headers for groups of dates
         # e.g., "Elementary Early Release Days - *FH, PG, & MEM :12:45 Dismissal"
         if 'Early Release' in line or 'First Day of School' in line or 'Last Day of School' in line:
-            current_section = line
+            current_section = sys.intern(line)
             # Don't continue - this line might also have dates
-            if not re.search(MONTHS, line, re.IGNORECASE):
+            if not _RE_HAS_MONTH.search(line):
                 continue
 
+        # Every date pattern below needs a day number, so a line with no
+        # digit at all can be dropped before any regex runs
+        if not any(c.isdigit() for c in line):
+            continue
+
+        # Lines without any month token can't match the patterns below
+        if not _RE_HAS_MONTH_TOKEN.search(line):
+            continue
+
         # Skip lines that are just day names with dates (the date will be on this line)
         # e.g., "Wednesday, September 24, 2025"
-        day_name_date = re.match(rf'^(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+{MONTHS}\s+(\d{{1,2}}),?\s*(\d{{4}})?', line, re.IGNORECASE)
+        day_name_date = _RE_DAY_NAME_DATE.match(line)
         if day_name_date:
             month = day_name_date.group(2)
             day = int(day_name_date.group(3))
             year = int(day_name_date.group(4)) if day_name_date.group(4) else get_school_year(month, default_year)
             try:
-                event_date = date_parser.parse(f"{month} {day}, {year}")
-                if current_section:
-                    event = create_event_dict(current_section, event_date, line)
-                    if event:
-                        events.append(event)
-            except:
-                pass
-            continue
-
-        # Pattern: "Month Day & Day, Year – Description" (date range in same month)
-        range_same_month = re.match(rf'^{MONTHS}\s+(\d{{1,2}})\s*[&]\s*(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(.+)$', line, re.IGNORECASE)
-        if range_same_month:
-            month = range_same_month.group(1)
-            start_day = int(range_same_month.group(2))
-            end_day = int(range_same_month.group(3))
-            year = int(range_same_month.group(4)) if range_same_month.group(4) else get_school_year(month, default_year)
-            description = range_same_month.group(5).strip()
-            for d in range(start_day, end_day + 1):
-                try:
-                    event_date = date_parser.parse(f"{month} {d}, {year}")
-                    event = create_event_dict(description, event_date, line)
-                    if event:
-                        events.append(event)
-                except:
-                    pass
+                event_date = datetime(year, _MONTH_TO_INT[month.lower()], day)
+            except (ValueError, KeyError):
+                continue
+            if current_section:
+                event = create_event_dict(current_section, event_date)
+                if event:
+                    events.append(event)
             continue
 
-        # Pattern: "Month Day – Day, Year – Description" (date range with dash)
-        range_dash = re.match(rf'^{MONTHS}\s+(\d{{1,2}})\s*[–\-]\s*(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(.+)$', line, re.IGNORECASE)
-        if range_dash:
-            month = range_dash.group(1)
-            start_day = int(range_dash.group(2))
-            end_day = int(range_dash.group(3))
-            year = int(range_dash.group(4)) if range_dash.group(4) else get_school_year(month, default_year)
-            description = range_dash.group(5).strip()
-            for d in range(start_day, end_day + 1):
-                try:
-                    event_date = date_parser.parse(f"{month} {d}, {year}")
-                    event = create_event_dict(description, event_date, line)
-                    if event:
-                        events.append(event)
-                except:
-                    pass
+        # Pattern: "Month Day & Day, Year – Description" or
+        # "Month Day – Day, Year – Description" (date range in same month)
+        day_range = _RE_DAY_RANGE.match(line)
+        if day_range:
+            month = day_range.group(1)
+            start_day = int(day_range.group(2))
+            end_day = int(day_range.group(3))
+            year = int(day_range.group(4)) if day_range.group(4) else get_school_year(month, default_year)
+            # Clean the shared title once, not once per day in the range
+            title = _clean_title(day_range.group(5))
+            if title:
+                month_num = _MONTH_TO_INT[month.lower()]
+                for d in range(start_day, end_day + 1):
+                    try:
+                        event_date = datetime(year, month_num, d)
+                    except ValueError:
+                        continue
+                    events.append(_make_event(title, event_date))
             continue
 
         # Pattern: "Month Day – Month Day, Year – Description" (cross-month range)
         # Supports both full month names and abbreviations like "Dec."
-        MONTHS_CROSS = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
-        cross_month = re.match(rf'^{MONTHS}\s+(\d{{1,2}})\s*[–\-]\s*{MONTHS_CROSS}\.?\s*(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(.+)$', line, re.IGNORECASE)
+        cross_month = _RE_CROSS_MONTH.match(line)
         if cross_month:
             start_month = cross_month.group(1)
             start_day = int(cross_month.group(2))
             end_month = cross_month.group(3)
             end_day = int(cross_month.group(4))
             year = int(cross_month.group(5)) if cross_month.group(5) else get_school_year(start_month, default_year)
-            description = cross_month.group(6).strip()
             try:
-                start_date = date_parser.parse(f"{start_month} {start_day}, {year}")
-                end_date = date_parser.parse(f"{end_month} {end_day}, {year}")
-                current = start_date
-                while current <= end_date:
-                    event = create_event_dict(description, current, line)
-                    if event:
-                        events.append(event)
-                    current += timedelta(days=1)
-            except:
-                pass
+                start_date = datetime(year, _MONTH_TO_INT[start_month.lower()], start_day)
+                end_date = datetime(year, _MONTH_TO_INT[end_month.lower()], end_day)
+            except (ValueError, KeyError):
+                continue
+            # Clean the shared title once, then expand the range by offset
+            title = _clean_title(cross_month.group(6))
+            if title:
+                n_days = (end_date - start_date).days + 1
+                events.extend(
+                    _make_event(title, start_date + timedelta(days=i))
+                    for i in range(n_days)
+                )
             continue
 
         # Pattern: "Month Day, Year – Description" (single date with description)
-        single_date = re.match(rf'^{MONTHS}\s+(\d{{1,2}}),?\s*(\d{{4}})?\s*[–\-]\s*(.+)$', line, re.IGNORECASE)
+        single_date = _RE_SINGLE_DATE.match(line)
         if single_date:
             month = single_date.group(1)
             day = int(single_date.group(2))
             year = int(single_date.group(3)) if single_date.group(3) else get_school_year(month, default_year)
             description = single_date.group(4).strip()
-            # Skip if description looks like another date (partial parsing issue)
-            if re.match(rf'^{MONTHS}', description, re.IGNORECASE) or re.match(r'^\d+,?$', description):
-                continue
             try:
-                event_date = date_parser.parse(f"{month} {day}, {year}")
-                event = create_event_dict(description, event_date, line)
-                if event:
-                    events.append(event)
-            except:
-                pass
+                event_date = datetime(year, _MONTH_TO_INT[month.lower()], day)
+            except (ValueError, KeyError):
+                continue
+            event = create_event_dict(description, event_date)
+            if event:
+                events.append(event)
             continue
 
         # Pattern: "Month Day, Year" alone (use section header as title)
-        standalone_date = re.match(rf'^{MONTHS}\s+(\d{{1,2}}),?\s*(\d{{4}})?$', line, re.IGNORECASE)
+        standalone_date = _RE_STANDALONE_DATE.match(line)
         if standalone_date and current_section:
             month = standalone_date.group(1)
             day = int(standalone_date.group(2))
             year = int(standalone_date.group(3)) if standalone_date.group(3) else get_school_year(month, default_year)
             try:
-                event_date = date_parser.parse(f"{month} {day}, {year}")
-                event = create_event_dict(current_section, event_date, line)
-                if event:
-                    events.append(event)
-            except:
-                pass
+                event_date = datetime(year, _MONTH_TO_INT[month.lower()], day)
+            except (ValueError, KeyError):
+                continue
+            event = create_event_dict(current_section, event_date)
+            if event:
+                events.append(event)
             continue
 
     return events
@@ -294,24 +431,11 @@ def parse_events(text: str, default_year: int) -> list:
 
 def expand_abbreviations(text: str) -> str:
     """Expand school name abbreviations."""
-    # Order matters - replace longer patterns first to avoid partial matches
-    replacements = [
-        (r'\*FH\b', 'Fox Hill'),
-        (r'\bFH\b', 'Fox Hill'),
-        (r'\*PG\b', 'Pine Glen'),
-        (r'\bPG\b', 'Pine Glen'),
-        (r'\*MEM\b', 'Memorial'),
-        (r'\bMEM\b', 'Memorial'),
-        (r'\*FW\b', 'Francis Wyman'),
-        (r'\bFW\b', 'Francis Wyman'),
-    ]
-    for pattern, full in replacements:
-        text = re.sub(pattern, full, text)
-    return text
+    return _ABBR_RE.sub(lambda m: _ABBR_MAP[m.group(1)], text)
 
 
-def create_event_dict(title: str, date: datetime, original_line: str) -> dict:
-    """Create an event dictionary from parsed data."""
+def _clean_title(title: str):
+    """Clean up a raw event title; returns None if it is unusable."""
     if not title or len(title) < 3:
         return None
 
@@ -334,68 +458,106 @@ def create_event_dict(title: str, date: datetime, original_line: str) -> dict:
     if len(title) < 3:
         return None
 
+    return title
+
+
+def _make_event(title: str, date: datetime) -> dict:
+    """Build an event dict for a title that has already been cleaned."""
     return {
         'title': title,
         'date': date,
         'start_time': None,  # All-day events for school calendar
         'end_time': None,
-        'description': '',
-        'original': original_line
+        'description': ''
     }
 
 
+def create_event_dict(title: str, date: datetime) -> dict:
+    """Create an event dictionary from parsed data."""
+    title = _clean_title(title)
+    if title is None:
+        return None
+    return _make_event(title, date)
+
+
+def _ics_escape(text: str) -> str:
+    """Escape special characters in ICS text values (RFC 5545 3.3.11)."""
+    return (text.replace('\\', '\\\\')
+                .replace(';', '\\;')
+                .replace(',', '\\,')
+                .replace('\n', '\\n'))
+
+
 def generate_ics(events: list, calendar_name: str, output_path: str) -> str:
     """Generate an ICS file from the list of events."""
-    cal = Calendar()
+    # ICS is a simple line-based text format, so write it directly instead
+    # of building icalendar Calendar/Event objects per event
+    lines = [
+        'BEGIN:VCALENDAR',
+        'PRODID:-//School Calendar Sync//MVP//EN',
+        'VERSION:2.0',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_ics_escape(calendar_name)}',
+        f'X-WR-TIMEZONE:{TIMEZONE}',
+    ]
 
-    # Add calendar metadata
-    cal.add('prodid', '-//School Calendar Sync//MVP//EN')
-    cal.add('version', '2.0')
-    cal.add('calscale', 'GREGORIAN')
-    cal.add('method', 'PUBLISH')
-    cal.add('x-wr-calname', calendar_name)
-    cal.add('x-wr-timezone', str(TIMEZONE))
+    # Hoist loop invariants: one timestamp for the whole generation run,
+    # and local bindings so the per-event work is all LOAD_FAST
+    stamp_line = 'DTSTAMP:' + datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    tzid = str(TIMEZONE)
+    one_day = timedelta(days=1)
+    append = lines.append
+    escape = _ics_escape
 
     for i, event_data in enumerate(events):
-        event = Event()
+        append('BEGIN:VEVENT')
 
         # Generate unique ID
         uid = f"school-event-{i}-{event_data['date'].strftime('%Y%m%d')}@schoolcalendar.local"
-        event.add('uid', uid)
+        append(f'UID:{uid}')
 
         # Add event title
-        event.add('summary', event_data['title'])
+        append(f"SUMMARY:{escape(event_data['title'])}")
 
         # Add date/time
         if event_data['start_time']:
-            # Event with specific time
-            start_dt = TIMEZONE.localize(event_data['start_time'])
-            event.add('dtstart', start_dt)
+            # Event with specific time (local wall-clock with TZID)
+            start = event_data['start_time'].strftime('%Y%m%dT%H%M%S')
+            append(f'DTSTART;TZID={tzid}:{start}')
             if event_data['end_time']:
-                end_dt = TIMEZONE.localize(event_data['end_time'])
-                event.add('dtend', end_dt)
+                end = event_data['end_time'].strftime('%Y%m%dT%H%M%S')
+                append(f'DTEND;TZID={tzid}:{end}')
         else:
             # All-day event
-            event.add('dtstart', event_data['date'].date())
-            event.add('dtend', (event_data['date'] + timedelta(days=1)).date())
+            start = event_data['date'].strftime('%Y%m%d')
+            end = (event_data['date'] + one_day).strftime('%Y%m%d')
+            append(f'DTSTART;VALUE=DATE:{start}')
+            append(f'DTEND;VALUE=DATE:{end}')
 
         # Add description if available
         if event_data['description']:
-            event.add('description', event_data['description'])
+            append(f"DESCRIPTION:{escape(event_data['description'])}")
 
-        # Add timestamp
-        event.add('dtstamp', datetime.now(pytz.UTC))
+        append(stamp_line)
+        append('END:VEVENT')
 
-        cal.add_component(event)
+    lines.append('END:VCALENDAR')
 
     # Create output directory if needed
     output_dir = os.path.dirname(output_path)
     if output_dir:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # Write the ICS file
-    with open(output_path, 'wb') as f:
-        f.write(cal.to_ical())
+    # Write the ICS file (CRLF line endings per RFC 5545) in one syscall,
+    # bypassing the buffered file object since the payload is one blob
+    buf = bytearray('\r\n'.join(lines), 'utf-8')
+    buf += b'\r\n'
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, memoryview(buf))
+    finally:
+        os.close(fd)
 
     return output_path
 
@@ -411,27 +573,31 @@ def main():
     print("=" * 50)
     print()
 
-    # Load configuration
-    print("Loading configuration...")
-    config = load_config()
+    # Start authentication in the background - it only needs the local
+    # credential files, so it can overlap with config loading
+    print("Authenticating with Google Docs API...")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        service_future = executor.submit(get_google_docs_service)
+
+        # Load configuration while the auth handshake is in flight
+        print("Loading configuration...")
+        config = load_config()
 
-    doc_url = config['google_doc_url']
-    output_file = config['output_file']
-    calendar_name = config['calendar_name']
-    default_year = config.get('school_year_start', config.get('default_year', 2025))
+        output_file = config['output_file']
+        calendar_name = config['calendar_name']
+        default_year = config.get('school_year_start', config.get('default_year', 2025))
 
-    # Extract document ID
-    doc_id = extract_doc_id(doc_url)
-    print(f"Document ID: {doc_id}")
+        # Extract document IDs (a single URL or an optional list)
+        doc_urls = config.get('google_doc_urls') or [config['google_doc_url']]
+        doc_ids = [extract_doc_id(url) for url in doc_urls]
+        print(f"Document ID(s): {', '.join(doc_ids)}")
 
-    # Authenticate with Google
-    print("\nAuthenticating with Google Docs API...")
-    service = get_google_docs_service()
+        service = service_future.result()
     print("✓ Authentication successful")
 
-    # Read the document
+    # Read the document(s) - multiple docs share one batched request
     print("\nReading document...")
-    doc_text = read_document(service, doc_id)
+    doc_text = '\n'.join(read_documents(service, doc_ids))
     print(f"✓ Read {len(doc_text)} characters from document")
 
     # Debug mode: save raw content and exit
@@ -455,10 +621,26 @@ def main():
         print("-" * 50)
         return
 
-    # Parse events from Google Doc
-    print("\nParsing events from Google Doc...")
-    gdoc_events = parse_events(doc_text, default_year)
-    print(f"✓ Found {len(gdoc_events)} events from Google Doc")
+    # Skip re-parsing when the document (and year) are unchanged since the
+    # last run - the parsed events are cached keyed by a hash of both
+    doc_hash = hashlib.blake2b(
+        f"{default_year}\n{doc_text}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+    cache_path = Path('cache') / f'{doc_hash}.pkl'
+
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            gdoc_events = pickle.load(f)
+        print(f"\n✓ Loaded {len(gdoc_events)} events from cache (document unchanged)")
+    else:
+        # Parse events from Google Doc
+        print("\nParsing events from Google Doc...")
+        gdoc_events = parse_events(doc_text, default_year)
+        print(f"✓ Found {len(gdoc_events)} events from Google Doc")
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(gdoc_events, f)
 
     # Parse events from local email files (if enabled)
     email_events = []
@@ -492,19 +674,21 @@ def main():
         print("PARSED EVENTS - PLEASE VERIFY")
         print("=" * 60)
 
-        # Group events by month
+        # Group events by month; (year, month) tuple keys sort natively,
+        # so no strptime round-trip is needed to order them
         from collections import defaultdict
         by_month = defaultdict(list)
         for event in events:
-            month_key = event['date'].strftime('%B %Y')
+            month_key = (event['date'].year, event['date'].month)
             by_month[month_key].append(event)
 
         # Sort months chronologically
-        sorted_months = sorted(by_month.keys(), key=lambda x: datetime.strptime(x, '%B %Y'))
+        sorted_months = sorted(by_month.keys())
 
         for month in sorted_months:
             month_events = sorted(by_month[month], key=lambda x: x['date'])
-            print(f"\n--- {month} ({len(month_events)} events) ---")
+            month_label = month_events[0]['date'].strftime('%B %Y')
+            print(f"\n--- {month_label} ({len(month_events)} events) ---")
             for event in month_events:
                 date_str = event['date'].strftime('%a, %b %d')
                 title = event['title'][:70] + '...' if len(event['title']) > 70 else event['title']
@@ -56,10 +56,10 @@ brew services start ollama 2>/dev/null || true
 sleep 2
 
 # Pull the model if not already downloaded
-MODEL="llama3.1:8b"
+MODEL="llama3.2:3b-instruct-q4_K_M"
 echo "Checking for $MODEL model..."
-if ! ollama list 2>/dev/null | grep -q "llama3.1"; then
-    echo "Downloading $MODEL model (~4.7GB, this may take a few minutes)..."
+if ! ollama list 2>/dev/null | grep -q "llama3.2:3b"; then
+    echo "Downloading $MODEL model (~2GB, this may take a few minutes)..."
     ollama pull $MODEL
 else
     echo "✓ $MODEL model found"
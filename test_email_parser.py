@@ -69,7 +69,7 @@ def load_config():
             'school_year_start': 2025,
             'email': {
                 'ollama': {
-                    'model': 'llama3.1:8b',
+                    'model': 'llama3.2:3b-instruct-q4_K_M',
                     'temperature': 0.1
                 }
             }